@@ -9,11 +9,28 @@ adu_permits.csv in the repo root.
 
 import csv
 import datetime as dt
+import io
+import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: noticeably faster on large ArcGIS responses
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+log = logging.getLogger(__name__)
 
 
 # -----------------------------
@@ -22,6 +39,37 @@ import requests
 
 OUTPUT_CSV = "adu_permits.csv"
 
+# Features requested per ArcGIS query page
+ARCGIS_PAGE_SIZE = 2000
+
+# Safety cap on ArcGIS query pages per source
+ARCGIS_MAX_PAGES = 500
+
+# Output file buffer; large enough that the CSV goes out in a few writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows serialized in memory per write to the output file
+WRITE_CHUNK_ROWS = 20_000
+
+# Upper bound on concurrent source fetches
+MAX_FETCH_WORKERS = 8
+
+# Shared HTTP session: keeps connections alive across requests and retries
+# transient server errors.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_FETCH_WORKERS,
+        pool_maxsize=2 * MAX_FETCH_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
 OUTPUT_FIELDNAMES = [
     "City",
     "Project_Name",
@@ -37,7 +85,7 @@ OUTPUT_FIELDNAMES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CitySource:
     city_name: str
     url: str
@@ -52,7 +100,8 @@ CITY_SOURCES: List[CitySource] = [
         url=(
             "https://services.arcgis.com/9YgDo7Ef8pPKUwMb/ArcGIS/rest/services/"
             "Accessory_Dwelling_Unit_ADU_Permits/FeatureServer/0/query"
-            "?where=1%3D1&outFields=*&f=json"
+            # Geometry is most of the payload and is never used
+            "?where=1%3D1&outFields=*&returnGeometry=false&f=json"
         ),
         type="arcgis_json",
         format="bellevue_arcgis",
@@ -64,6 +113,41 @@ CITY_SOURCES: List[CitySource] = [
 # NORMALIZERS
 # -----------------------------
 
+# Candidate attribute names per field, in order of preference.
+# Some typical field names in Bellevue's layer; adjust if needed.
+PROJECT_NAME_KEYS = ("ProjectName", "PROJECT_NAME")
+ADU_TYPE_KEYS = ("ADUType", "ADU_TYPE")
+STATUS_KEYS = ("Status", "PERMIT_STATUS")
+PERMIT_NUMBER_KEYS = ("PermitNumber", "PERMIT_NUMBER")
+PARCEL_KEYS = ("ParcelNumber", "PARCEL")
+ZONE_KEYS = ("Zoning", "ZONE")
+ADU_SIZE_SQFT_KEYS = ("ADUSizeSqft", "ADU_SIZE_SQFT")
+SOURCE_URL_KEYS = ("DetailPageURL", "URL", "LINK")
+NOTES_KEYS = ("Notes",)
+
+# Output field -> candidate attribute names, for the plain text fields
+ARCGIS_TEXT_FIELDS = (
+    ("Project_Name", PROJECT_NAME_KEYS),
+    ("ADU_Type", ADU_TYPE_KEYS),
+    ("Status", STATUS_KEYS),
+    ("Permit_Number", PERMIT_NUMBER_KEYS),
+    ("Parcel", PARCEL_KEYS),
+    ("Zone", ZONE_KEYS),
+    ("ADU_Size_Sqft", ADU_SIZE_SQFT_KEYS),
+    ("Source_URL", SOURCE_URL_KEYS),
+    ("Notes", NOTES_KEYS),
+)
+
+
+_EPOCH = dt.date(1970, 1, 1)
+_MS_PER_DAY = 86_400_000
+
+
+@lru_cache(maxsize=None)
+def _epoch_day_iso(day: int) -> str:
+    # Cached: most permits share a small set of approval days
+    return (_EPOCH + dt.timedelta(days=day)).isoformat()
+
 
 def normalize_bellevue_arcgis(feature: Dict[str, Any]) -> Dict[str, str]:
     """
@@ -71,21 +155,17 @@ def normalize_bellevue_arcgis(feature: Dict[str, Any]) -> Dict[str, str]:
     into our unified OUTPUT_FIELDNAMES schema.
     """
     attrs = feature.get("attributes", {}) or {}
-
-    def get_attr(key: str) -> str:
-        val = attrs.get(key)
-        return "" if val is None else str(val).strip()
+    attrs_get = attrs.get
 
     # Approval date often stored as epoch milliseconds in ArcGIS
-    approval_raw = attrs.get("ApprovalDate") or attrs.get("Approval_Date")
+    approval_raw = attrs_get("ApprovalDate") or attrs_get("Approval_Date")
     approval_iso: str = ""
     if isinstance(approval_raw, (int, float)):
         try:
-            # ArcGIS uses milliseconds since epoch
-            approval_iso = dt.datetime.utcfromtimestamp(
-                approval_raw / 1000.0
-            ).date().isoformat()
-        except Exception:
+            # ArcGIS uses milliseconds since epoch; whole days since epoch
+            # give the UTC calendar date
+            approval_iso = _epoch_day_iso(int(approval_raw) // _MS_PER_DAY)
+        except (OverflowError, ValueError):
             approval_iso = ""
     elif isinstance(approval_raw, str):
         # If already string, best effort
@@ -94,34 +174,21 @@ def normalize_bellevue_arcgis(feature: Dict[str, Any]) -> Dict[str, str]:
         except Exception:
             approval_iso = approval_raw.strip()
 
-    # Some typical field names in Bellevue's layer; adjust if needed
-    project_name = get_attr("ProjectName") or get_attr("PROJECT_NAME")
-    adu_type = get_attr("ADUType") or get_attr("ADU_TYPE")
-    status = get_attr("Status") or get_attr("PERMIT_STATUS")
-    permit_no = get_attr("PermitNumber") or get_attr("PERMIT_NUMBER")
-    parcel = get_attr("ParcelNumber") or get_attr("PARCEL")
-    zone = get_attr("Zoning") or get_attr("ZONE")
-    size_sqft = get_attr("ADUSizeSqft") or get_attr("ADU_SIZE_SQFT")
-    source_url = (
-        get_attr("DetailPageURL")
-        or get_attr("URL")
-        or get_attr("LINK")
-    )
-    notes = get_attr("Notes")
-
-    return {
-        "City": "Bellevue",
-        "Project_Name": project_name,
-        "ADU_Type": adu_type,
-        "Status": status,
-        "Permit_Number": permit_no,
-        "Parcel": parcel,
-        "Zone": zone,
-        "ADU_Size_Sqft": size_sqft,
-        "Approval_Date": approval_iso,
-        "Source_URL": source_url,
-        "Notes": notes,
-    }
+    row = {"City": "Bellevue", "Approval_Date": approval_iso}
+
+    # First non-empty candidate wins; inlined since this runs per field per row
+    for field, keys in ARCGIS_TEXT_FIELDS:
+        text = ""
+        for key in keys:
+            val = attrs_get(key)
+            if val is None:
+                continue
+            text = val.strip() if type(val) is str else str(val).strip()
+            if text:
+                break
+        row[field] = text
+
+    return row
 
 
 # Map format name -> normalizer function
@@ -129,124 +196,182 @@ NORMALIZERS = {
     "bellevue_arcgis": normalize_bellevue_arcgis,
 }
 
+# Source types fetch_all_cities knows how to parse
+SUPPORTED_SOURCE_TYPES = {"arcgis_json"}
+
 
 # -----------------------------
 # MAIN FETCH / WRITE LOGIC
 # -----------------------------
 
 
-def fetch_all_cities() -> List[Dict[str, str]]:
-    all_rows: List[Dict[str, str]] = []
+def iter_arcgis_features(url: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield features from an ArcGIS FeatureServer query URL, one page at a
+    time, so results beyond the server's maxRecordCount aren't truncated.
+    """
+    offset = 0
+    previous: List[Dict[str, Any]] = []
+    # No orderByFields: the object-ID field name varies by layer, and the
+    # server already orders by it when paginating.
+    for _ in range(ARCGIS_MAX_PAGES):
+        resp = SESSION.get(
+            f"{url}&resultOffset={offset}&resultRecordCount={ARCGIS_PAGE_SIZE}",
+            timeout=60,
+        )
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+        if "error" in data:
+            # ArcGIS reports query errors in a 200 response body
+            raise ValueError(f"ArcGIS error: {data['error']}")
+
+        features = data.get("features", [])
+        if features and features == previous:
+            # Server ignores resultOffset and keeps returning the first page
+            log.warning("%s does not support pagination; results truncated", url)
+            return
+        yield from features
+
+        if not features or not data.get("exceededTransferLimit"):
+            return
+        offset += len(features)
+        previous = features
+
+    log.warning(
+        "Stopped after %d pages from %s; results truncated", ARCGIS_MAX_PAGES, url
+    )
 
-    for src in CITY_SOURCES:
-        print(f"[INFO] Fetching {src.city_name} from {src.url}")
 
-        try:
-            resp = requests.get(src.url, timeout=60)
-        except Exception as e:
-            print(f"[WARN] Request error for {src.city_name}: {e}", file=sys.stderr)
-            continue
+def fetch_source_rows(src: CitySource) -> List[Dict[str, str]]:
+    normalizer = NORMALIZERS[src.format]
+    # src.type == "arcgis_json"
+    return [normalizer(feat) for feat in iter_arcgis_features(src.url)]
 
-        if resp.status_code != 200:
-            print(
-                f"[WARN] {src.url} returned {resp.status_code} "
-                f"for {src.city_name}",
-                file=sys.stderr,
-            )
-            continue
-
-        out_rows: List[Dict[str, str]] = []
 
-        if src.type == "arcgis_json":
-            try:
-                data = resp.json()
-            except Exception as e:
-                print(
-                    f"[WARN] Failed to parse JSON for {src.city_name}: {e}",
-                    file=sys.stderr,
+def fetch_all_cities() -> List[Dict[str, str]]:
+    all_rows: List[Dict[str, str]] = []
+    counts: Dict[str, int] = {}
+
+    # Requests are I/O bound, so fetch all sources at once and handle the
+    # results in source order once they are all back.
+    workers = max(1, min(MAX_FETCH_WORKERS, len(CITY_SOURCES)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for src in CITY_SOURCES:
+            # Don't spend a request on a source we could not process
+            if src.type not in SUPPORTED_SOURCE_TYPES:
+                log.warning(
+                    "Unsupported source type %s for %s", src.type, src.city_name
                 )
                 continue
-
-            features = data.get("features", [])
-            normalizer = NORMALIZERS.get(src.format)
-            if not normalizer:
-                print(
-                    f"[WARN] No normalizer for format {src.format}",
-                    file=sys.stderr,
-                )
+            if src.format not in NORMALIZERS:
+                log.warning("No normalizer for format %s", src.format)
                 continue
 
-            for feat in features:
-                out = normalizer(feat)
-                out_rows.append(out)
-        else:
-            print(
-                f"[WARN] Unsupported source type {src.type} for {src.city_name}",
-                file=sys.stderr,
-            )
+            log.debug("Fetching %s from %s", src.city_name, src.url)
+            pending.append((src, pool.submit(fetch_source_rows, src)))
+
+    for src, future in pending:
+        try:
+            out_rows = future.result()
+        except Exception as e:
+            log.warning("Fetch error for %s: %s", src.city_name, e)
             continue
 
-        print(f"[INFO] {src.city_name}: collected {len(out_rows)} rows")
+        counts[src.city_name] = len(out_rows)
         all_rows.extend(out_rows)
 
+    if counts:
+        log.info(
+            "Collected %d rows (%s)",
+            len(all_rows),
+            ", ".join(f"{city}: {n}" for city, n in counts.items()),
+        )
     return all_rows
 
 
+@lru_cache(maxsize=None)
+def parse_date(s: str) -> dt.date:
+    # Cached: permit data repeats the same approval dates many times over
+    if len(s) < 10:
+        # Covers the common empty case without raising; undated rows sort last
+        return _EPOCH
+    try:
+        return dt.date.fromisoformat(s[:10])
+    except ValueError:
+        return _EPOCH
+
+
+def is_cancelled(status: str) -> bool:
+    # Only the leading word matters, so lowercase just those characters
+    # rather than the whole status string
+    return status.lstrip()[:6].lower() == "cancel"
+
+
 def filter_and_sort_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
     if not rows:
         return []
 
-    # Drop cancelled/canceled permits
-    filtered: List[Dict[str, str]] = []
+    # Drop cancelled/canceled permits and pair each kept row with its
+    # approval date in the same pass
+    decorated: List[Tuple[dt.date, Dict[str, str]]] = []
+    append = decorated.append
     for row in rows:
-        status = (row.get("Status") or "").strip().lower()
-        if status.startswith("cancel"):
+        if is_cancelled(row.get("Status") or ""):
             continue
-        filtered.append(row)
+        append((parse_date(row.get("Approval_Date", "")), row))
 
     # Sort by approval date desc
-    def parse_date(s: str) -> dt.date:
-        try:
-            return dt.datetime.fromisoformat(s[:10]).date()
-        except Exception:
-            return dt.date(1970, 1, 1)
+    decorated.sort(key=itemgetter(0), reverse=True)
 
-    filtered.sort(
-        key=lambda r: parse_date(r.get("Approval_Date", "")),
-        reverse=True,
-    )
+    return [r for _, r in decorated]
 
-    return filtered
+
+# Pulls a normalized row's values out in OUTPUT_FIELDNAMES order
+_row_values = itemgetter(*OUTPUT_FIELDNAMES)
 
 
 def write_csv(rows: List[Dict[str, str]], path: str = OUTPUT_CSV) -> None:
     if not rows:
-        print(
-            "[WARN] No rows to write; not overwriting existing adu_permits.csv",
-            file=sys.stderr,
-        )
+        log.warning("No rows to write; not overwriting existing %s", path)
         return
 
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDNAMES)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    # Serialize into memory and hand the file one large string per chunk,
+    # rather than going through the text layer once per row
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(OUTPUT_FIELDNAMES)
+
+    with open(
+        path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as f:
+        for start in range(0, len(rows), WRITE_CHUNK_ROWS):
+            writer.writerows(
+                map(_row_values, rows[start:start + WRITE_CHUNK_ROWS])
+            )
+            f.write(buf.getvalue())
+            buf.seek(0)
+            buf.truncate()
 
-    print(f"[INFO] Wrote {len(rows)} rows to {path}")
+    log.info("Wrote %d rows to %s", len(rows), path)
 
 
 def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(message)s", stream=sys.stderr
+    )
+    started = time.perf_counter()
+
     rows = fetch_all_cities()
     if not rows:
-        print(
-            "[WARN] No rows collected; keeping existing adu_permits.csv (if any).",
-            file=sys.stderr,
+        log.warning(
+            "No rows collected; keeping existing %s (if any).", OUTPUT_CSV
         )
         return 0
 
     cleaned = filter_and_sort_rows(rows)
     write_csv(cleaned, OUTPUT_CSV)
+    log.info("Finished in %.1fs", time.perf_counter() - started)
     return 0
 
 